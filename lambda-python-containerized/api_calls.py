@@ -1,28 +1,70 @@
 import requests
 import time
 import logging
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib json decoding
+    orjson = None
 
 logger = logging.getLogger()
 
+# Connections kept per host by the shared session's adapter
+_POOL_MAXSIZE = 16
+
+# (connect, read) seconds; a slow connect fails fast instead of eating the whole read budget
+_DEFAULT_TIMEOUT = (3.05, 10)
+
+# Retry GETs on connect failures and gateway errors only; a read timeout is not retried,
+# so one slow response costs at most the read budget rather than a multiple of it
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(['GET'])
+)
+
+# Shared HTTP session so warm invocations reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=_POOL_MAXSIZE,
+    max_retries=_RETRY
+))
+_SESSION.headers.update({'Accept': 'application/json'})
+
 class APIDAL:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _SESSION
     
-    def fetch_data(self, endpoint, params=None):
+    def fetch_data(self, endpoint, params=None, timeout=_DEFAULT_TIMEOUT):
         """Fetch data from external API."""
         try:
-            start_time = time.time()
-            response = self.session.get(endpoint, params=params)
-            response_time = time.time() - start_time
+            logger.debug("API Request - %s started", endpoint)
+            start_time = time.perf_counter()
+            response = self.session.get(endpoint, params=params, timeout=timeout)
+            response_time = time.perf_counter() - start_time
+            status_code = response.status_code
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
-            logger.info(f"API Request - {endpoint} completed in {response_time:.3f}s")
+            # Single terminal record per request instead of per-stage logs;
+            # content length comes from the header, which may be absent for chunked responses
+            logger.info(
+                "API Request - %s completed in %.3fs (status=%s, content_length=%s, keys=%s)",
+                endpoint, response_time, status_code,
+                response.headers.get('Content-Length', 'unknown'),
+                list(data) if isinstance(data, dict) else type(data).__name__
+            )
             return {
-                'status_code': response.status_code,
-                'data': response.json(),
+                'status_code': status_code,
+                'data': data,
                 'response_time': response_time,
                 'endpoint': endpoint
             }
         except Exception as e:
-            logger.error(f"API Request - Error: {str(e)}")
-            raise 
\ No newline at end of file
+            logger.error("API Request - Error: %s", e)
+            raise
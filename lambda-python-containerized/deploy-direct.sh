@@ -199,6 +199,8 @@ create_deployment_package() {
     cp s3_api.py "$PACKAGE_DIR/"
     cp api_calls.py "$PACKAGE_DIR/"
     cp postgresql_api.py "$PACKAGE_DIR/"
+    cp log_utils.py "$PACKAGE_DIR/"
+    cp lumigo_utils.py "$PACKAGE_DIR/"
     
     # Create a clean virtual environment for dependencies
     print_status "Creating clean virtual environment for dependencies..."
@@ -216,6 +218,10 @@ create_deployment_package() {
     print_status "Installing psycopg2-binary for AMD64 platform..."
     pip install --quiet --platform manylinux2014_x86_64 --only-binary=:all: --target "$PACKAGE_DIR" psycopg2-binary==2.9.9
     
+    # Install orjson for AMD64 platform (Lambda runtime)
+    print_status "Installing orjson for AMD64 platform..."
+    pip install --quiet --platform manylinux2014_x86_64 --only-binary=:all: --target "$PACKAGE_DIR" orjson
+    
     # Deactivate virtual environment
     deactivate
     
@@ -1,17 +1,16 @@
-import json
 import os
-import time
+import itertools
 import logging
 import requests
-import boto3
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from functools import wraps
 
 # Import the separate API modules
 from dynamodb_api import DynamoDBDAL
 from s3_api import S3DAL
 from api_calls import APIDAL
+from log_utils import LazyJSON, safe_json_serialize, capped_json_serialize
+from lumigo_utils import add_execution_tags
 
 # =============================================================================
 # LUMIGO INSTRUMENTATION HELPERS
@@ -26,6 +25,14 @@ from lumigo_tracer import add_execution_tag, error
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Round-robin API endpoints, built once per container
+_API_ENDPOINTS = (
+    "https://jsonplaceholder.typicode.com/posts/1",
+    "https://jsonplaceholder.typicode.com/posts/2",
+    "https://jsonplaceholder.typicode.com/posts/3"
+)
+_API_ROUND_ROBIN = itertools.cycle(range(len(_API_ENDPOINTS)))
+
 # def add_execution_tag(key, value):
 #     """
 #     Add an execution tag to the current span.
@@ -50,30 +57,25 @@ logger.setLevel(logging.INFO)
 #     except Exception as e:
 #         logger.error(f"Failed to add programmatic error: {str(e)}")
 
-def add_programmatic_error(error_type, error_message):
+def _error_response(status_code, error_message, request_id):
     """
-    Add a programmatic error using Lumigo tracer.
-    Based on https://docs.lumigo.io/docs/programmatic-errors
+    Build the handler's error response: the status code and a JSON body with the message and request id.
     """
-    try:
-        error(error_message, error_type)
-        logger.error(f"Added programmatic error: {error_type} - {error_message}")
-    except Exception as e:
-        logger.error(f"Failed to add programmatic error: {str(e)}")
+    return {
+        'statusCode': status_code,
+        'body': safe_json_serialize({'error': error_message, 'request_id': request_id})
+    }
 
-def safe_json_serialize(obj):
+def add_programmatic_error(error_type, error_message, extras=None):
     """
-    Safely serialize objects that may contain datetime or other non-JSON serializable types.
+    Add a programmatic error using Lumigo tracer, with optional string-valued extra details.
+    Based on https://docs.lumigo.io/docs/programmatic-errors
     """
-    def default_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return str(obj)
-    
-    return json.dumps(obj, default=default_serializer)
+    try:
+        error(error_message, error_type, extra={key: str(value) for key, value in (extras or {}).items()})
+        logger.error("Added programmatic error: %s - %s", error_type, error_message)
+    except Exception as e:
+        logger.error("Failed to add programmatic error: %s", e)
 
 def perform_s3_operations():
     """
@@ -87,7 +89,7 @@ def perform_s3_operations():
         # Add execution tag for S3 bucket
         add_execution_tag("s3_bucket", dal.bucket_name)
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Handler",
             "Data_Target": "S3_Operations",
             "Data_Artifacts": {
@@ -103,10 +105,10 @@ def perform_s3_operations():
         
         if bucket_ready:
             # Generate unique identifiers for this operation
-            operation_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            operation_id = os.urandom(16).hex()
+            timestamp = datetime.now(timezone.utc).isoformat()
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Lifecycle_Operations_Start",
                 "Data_Artifacts": {
@@ -120,7 +122,7 @@ def perform_s3_operations():
             
             try:
                 # Step 1: Upload sample objects (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Upload_Objects",
                     "Data_Artifacts": {
@@ -134,7 +136,7 @@ def perform_s3_operations():
                 upload_results = dal.upload_sample_objects(operation_id, timestamp)
                 objects_created = upload_results.get('objects_created', 0)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Upload_Objects_Complete",
                     "Data_Artifacts": {
@@ -147,7 +149,7 @@ def perform_s3_operations():
                 }))
                 
                 # Step 2: List objects in the bucket (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "List_Objects",
                     "Data_Artifacts": {
@@ -161,7 +163,7 @@ def perform_s3_operations():
                 list_results = dal.list_bucket_objects(operation_id)
                 object_count = list_results.get('object_count', 0)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "List_Objects_Complete",
                     "Data_Artifacts": {
@@ -174,7 +176,7 @@ def perform_s3_operations():
                 }))
                 
                 # Step 3: Delete the objects we created (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Delete_Objects",
                     "Data_Artifacts": {
@@ -185,10 +187,10 @@ def perform_s3_operations():
                     }
                 }))
                 
-                delete_results = dal.delete_bucket_objects(operation_id)
+                delete_results = dal.delete_bucket_objects(operation_id, keys=list_results['object_keys'])
                 objects_deleted = delete_results.get('objects_deleted', 0)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Delete_Objects_Complete",
                     "Data_Artifacts": {
@@ -200,7 +202,7 @@ def perform_s3_operations():
                     }
                 }))
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Lifecycle_Operations_Complete",
                     "Data_Artifacts": {
@@ -220,7 +222,7 @@ def perform_s3_operations():
                 }
                 
             except Exception as e:
-                logger.error(safe_json_serialize({
+                logger.error(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Lifecycle_Operations_Error",
                     "Data_Artifacts": {
@@ -234,7 +236,7 @@ def perform_s3_operations():
                 }))
                 raise
         else:
-            logger.error(safe_json_serialize({
+            logger.error(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Bucket_Setup_Error",
                 "Data_Artifacts": {
@@ -250,7 +252,7 @@ def perform_s3_operations():
             }
             
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "S3_Operations_Error",
             "Data_Artifacts": {
@@ -276,18 +278,13 @@ def perform_api_operations():
         dal = APIDAL()
         
         # Round-robin through API endpoints
-        api_endpoints = [
-            "https://jsonplaceholder.typicode.com/posts/1",
-            "https://jsonplaceholder.typicode.com/posts/2", 
-            "https://jsonplaceholder.typicode.com/posts/3"
-        ]
-        endpoint_index = (int(time.time()) % len(api_endpoints))
-        endpoint = api_endpoints[endpoint_index]
+        endpoint_index = next(_API_ROUND_ROBIN)
+        endpoint = _API_ENDPOINTS[endpoint_index]
         
         # Add execution tag for API URL
         add_execution_tag("api_url", endpoint)
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Handler",
             "Data_Target": "API_Operations",
             "Data_Artifacts": {
@@ -301,7 +298,7 @@ def perform_api_operations():
         # Make the API call (wrapped service call)
         response = dal.fetch_data(endpoint)
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "API_Operations",
             "Data_Target": "API_Call_Complete",
             "Data_Artifacts": {
@@ -324,7 +321,7 @@ def perform_api_operations():
         }
         
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "API_Operations",
             "Data_Target": "API_Error",
             "Data_Artifacts": {
@@ -350,10 +347,9 @@ def perform_database_operations(table_name=None):
         dal = DynamoDBDAL(table_name)
         
         # Add execution tags for database and table
-        add_execution_tag("database", "DynamoDB")
-        add_execution_tag("database_table", dal.table_name)
+        add_execution_tags({"database": "DynamoDB", "database_table": dal.table_name})
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Handler",
             "Data_Target": "Database_Operations",
             "Data_Artifacts": {
@@ -369,10 +365,10 @@ def perform_database_operations(table_name=None):
         
         if table_ready:
             # Generate unique item ID
-            item_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            item_id = os.urandom(16).hex()
+            timestamp = datetime.now(timezone.utc).isoformat()
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "Database_Operations",
                 "Data_Target": "CRUD_Operations_Start",
                 "Data_Artifacts": {
@@ -386,7 +382,7 @@ def perform_database_operations(table_name=None):
             
             try:
                 # Step 1: Create item (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Create_Item",
                     "Data_Artifacts": {
@@ -398,14 +394,14 @@ def perform_database_operations(table_name=None):
                 }))
                 
                 item_data = {
-                    'id': {'S': item_id},
-                    'data': {'S': 'Sample data'},
-                    'timestamp': {'S': timestamp},
-                    'status': {'S': 'active'}
+                    'id': item_id,
+                    'data': 'Sample data',
+                    'timestamp': timestamp,
+                    'status': 'active'
                 }
                 create_response = dal.create_item(item_data)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Create_Item_Complete",
                     "Data_Artifacts": {
@@ -417,7 +413,7 @@ def perform_database_operations(table_name=None):
                 }))
                 
                 # Step 2: Read item (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Read_Item",
                     "Data_Artifacts": {
@@ -430,7 +426,7 @@ def perform_database_operations(table_name=None):
                 
                 read_response = dal.read_item(item_id)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Read_Item_Complete",
                     "Data_Artifacts": {
@@ -442,7 +438,7 @@ def perform_database_operations(table_name=None):
                 }))
                 
                 # Step 3: Update item (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Update_Item",
                     "Data_Artifacts": {
@@ -459,7 +455,7 @@ def perform_database_operations(table_name=None):
                 }
                 update_response = dal.update_item(item_id, updates)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Update_Item_Complete",
                     "Data_Artifacts": {
@@ -471,7 +467,7 @@ def perform_database_operations(table_name=None):
                 }))
                 
                 # Step 4: Delete item (wrapped service call)
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Delete_Item",
                     "Data_Artifacts": {
@@ -484,7 +480,7 @@ def perform_database_operations(table_name=None):
                 
                 delete_response = dal.delete_item(item_id)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "Delete_Item_Complete",
                     "Data_Artifacts": {
@@ -495,7 +491,7 @@ def perform_database_operations(table_name=None):
                     }
                 }))
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "CRUD_Operations_Complete",
                     "Data_Artifacts": {
@@ -514,7 +510,7 @@ def perform_database_operations(table_name=None):
                 }
                 
             except Exception as e:
-                logger.error(safe_json_serialize({
+                logger.error(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "CRUD_Operations_Error",
                     "Data_Artifacts": {
@@ -528,7 +524,7 @@ def perform_database_operations(table_name=None):
                 }))
                 raise
         else:
-            logger.error(safe_json_serialize({
+            logger.error(LazyJSON({
                 "Data_Source": "Database_Operations",
                 "Data_Target": "Table_Setup_Error",
                 "Data_Artifacts": {
@@ -544,7 +540,7 @@ def perform_database_operations(table_name=None):
             }
             
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "Database_Operations",
             "Data_Target": "Database_Operations_Error",
             "Data_Artifacts": {
@@ -573,15 +569,17 @@ def lambda_handler(event, context):
     """
     try:
         
-        # Log the incoming event
-        logger.info(safe_json_serialize({
+        # Log the incoming event's shape; the full (capped) payload only at DEBUG
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Event",
             "Data_Target": "Lambda_Handler",
             "Data_Artifacts": {
-                "event": event,
+                "event_keys": list(event) if isinstance(event, dict) else type(event).__name__,
                 "request_id": context.aws_request_id
             }
         }))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(capped_json_serialize({"event": event, "request_id": context.aws_request_id}))
         
         # API calls
         try:
@@ -621,7 +619,7 @@ def lambda_handler(event, context):
         # Return success response
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': safe_json_serialize({
                 'message': 'Lambda function executed successfully',
                 'api_data': api_data,
                 's3_data': s3_data,
@@ -634,7 +632,7 @@ def lambda_handler(event, context):
     except requests.RequestException as e:
         # Wrap HTTP errors with Lumigo programmatic errors
         error_message = f"HTTP request failed: {str(e)}"
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "HTTP_Request",
             "Data_Target": "Error_Handling",
             "Data_Artifacts": {
@@ -647,18 +645,12 @@ def lambda_handler(event, context):
             "error_code": getattr(e.response, 'status_code', 'unknown') if hasattr(e, 'response') else 'unknown'
         })
         
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': error_message,
-                'request_id': context.aws_request_id
-            })
-        }
+        return _error_response(500, error_message, context.aws_request_id)
         
     except Exception as e:
         # Wrap general errors with Lumigo programmatic errors
         error_message = f"Lambda execution failed: {str(e)}"
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Execution",
             "Data_Target": "Error_Handling",
             "Data_Artifacts": {
@@ -675,10 +667,4 @@ def lambda_handler(event, context):
             "request_id": context.aws_request_id
         })
         
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': error_message,
-                'request_id': context.aws_request_id
-            })
-        }
+        return _error_response(500, error_message, context.aws_request_id)
@@ -1,20 +1,23 @@
-import json
 import os
 import time
+import itertools
 import logging
 import requests
-import boto3
 import uuid
 import random
 import signal
-from datetime import datetime
-from functools import wraps
+import contextvars
+from datetime import datetime, timezone
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Import the separate API modules
-from dynamodb_api import DynamoDBDAL
+from dynamodb_api import DynamoDBDAL, precheck_tables
 from s3_api import S3DAL
 from api_calls import APIDAL
 from postgresql_api import PostgreSQLDAL
+from log_utils import LazyJSON, safe_json_serialize, capped_json_serialize, install_buffered_handler
+from lumigo_utils import add_execution_tags
 
 # =============================================================================
 # LUMIGO INSTRUMENTATION HELPERS
@@ -47,30 +50,91 @@ def timeout(seconds):
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def add_programmatic_error(error_type, error_message):
-    """
-    Add a programmatic error using Lumigo tracer.
-    Based on https://docs.lumigo.io/docs/programmatic-errors
-    """
+# Batch log records per invocation in front of the runtime's handlers; lambda_handler flushes before returning
+_LOG_HANDLER = install_buffered_handler(logger)
+
+# Round-robin API endpoints, built once per container
+_API_ENDPOINTS = (
+    "https://jsonplaceholder.typicode.com/posts/1",
+    "https://jsonplaceholder.typicode.com/posts/2",
+    "https://jsonplaceholder.typicode.com/posts/3"
+)
+_API_ROUND_ROBIN = itertools.cycle(range(len(_API_ENDPOINTS)))
+
+# Pre-rendered JSON for the fixed-shape start records. The interpolated values (bucket,
+# table and endpoint names) never contain characters that need JSON escaping.
+_S3_START_LOG = (
+    '{"Data_Source":"Lambda_Handler","Data_Target":"S3_Operations","Data_Artifacts":'
+    '{"bucket_name":"%s","aws_service":"S3","action":"s3_operations_start","service":"S3_API"}}'
+)
+_API_START_LOG = (
+    '{"Data_Source":"Lambda_Handler","Data_Target":"API_Operations","Data_Artifacts":'
+    '{"endpoint":"%s","round_robin_index":%d,"action":"api_operations_start","service":"JSONPlaceholder_API"}}'
+)
+_DATABASE_START_LOG = (
+    '{"Data_Source":"Lambda_Handler","Data_Target":"Database_Operations","Data_Artifacts":'
+    '{"table_name":"%s","aws_service":"DynamoDB","action":"database_operations_start","service":"DynamoDB_API"}}'
+)
+_RDS_START_LOG = (
+    '{"Data_Source":"Lambda_Handler","Data_Target":"RDS_Operations","Data_Artifacts":'
+    '{"database_type":"RDS_PostgreSQL","table_name":"%s","aws_service":"RDS","action":"rds_operations_start","service":"RDS_PostgreSQL_API"}}'
+)
+
+# Runs the independent API, S3 and DynamoDB operations side by side; reused across warm invocations.
+# RDS stays on the handler thread because its timeout relies on SIGALRM.
+_EXECUTOR = ThreadPoolExecutor(max_workers=3)
+
+# Look the DynamoDB tables up during Lambda container init rather than on the first request;
+# only existing tables are recorded, and missing ones are created by the per-request ensure_table_exists.
+# Skipped outside Lambda so importing the module (e.g. the local run below) makes no AWS calls
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
     try:
-        error(error_message, error_type)
-        logger.error(f"Added programmatic error: {error_type} - {error_message}")
+        precheck_tables()
     except Exception as e:
-        logger.error(f"Failed to add programmatic error: {str(e)}")
+        logger.warning("DynamoDB table pre-check failed during init: %s", e)
+
+# Hand init-time records to the runtime now instead of holding them until the first invocation ends
+_LOG_HANDLER.flush()
 
-def safe_json_serialize(obj):
+@lru_cache(maxsize=1)
+def _get_api_dal():
     """
-    Safely serialize objects that may contain datetime or other non-JSON serializable types.
+    Return the APIDAL shared by every invocation in this container.
     """
-    def default_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return str(obj)
-    
-    return json.dumps(obj, default=default_serializer)
+    return APIDAL()
+
+def _submit(fn):
+    """
+    Run fn on the shared executor inside a copy of the caller's context, so
+    context-variable based trace state follows the work onto the worker thread.
+    """
+    return _EXECUTOR.submit(contextvars.copy_context().run, fn)
+
+def _elapsed_ms(start):
+    """
+    Milliseconds since a time.perf_counter() reading, rounded for logging.
+    """
+    return round((time.perf_counter() - start) * 1000, 2)
+
+def _error_response(status_code, error_message, request_id):
+    """
+    Build the handler's error response: the status code and a JSON body with the message and request id.
+    """
+    return {
+        'statusCode': status_code,
+        'body': safe_json_serialize({'error': error_message, 'request_id': request_id})
+    }
+
+def add_programmatic_error(error_type, error_message, extras=None):
+    """
+    Add a programmatic error using Lumigo tracer, with optional string-valued extra details.
+    Based on https://docs.lumigo.io/docs/programmatic-errors
+    """
+    try:
+        error(error_message, error_type, extra={key: str(value) for key, value in (extras or {}).items()})
+        logger.error("Added programmatic error: %s - %s", error_type, error_message)
+    except Exception as e:
+        logger.error("Failed to add programmatic error: %s", e)
 
 def perform_s3_operations():
     """
@@ -84,129 +148,60 @@ def perform_s3_operations():
         # Add execution tag for S3 bucket
         add_execution_tag("s3_bucket", dal.bucket_name)
         
-        logger.info(safe_json_serialize({
-            "Data_Source": "Lambda_Handler",
-            "Data_Target": "S3_Operations",
-            "Data_Artifacts": {
-                "bucket_name": dal.bucket_name,
-                "aws_service": "S3",
-                "action": "s3_operations_start",
-                "service": "S3_API"
-            }
-        }))
+        logger.info(_S3_START_LOG, dal.bucket_name)
         
         # Check if bucket exists and create if needed
         bucket_ready = dal.ensure_bucket_exists()
         
         if bucket_ready:
             # Generate unique identifiers for this operation
-            operation_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            operation_id = os.urandom(16).hex()
+            timestamp = datetime.now(timezone.utc).isoformat()
+            
+            # Identity fields shared by every record of this lifecycle
+            base_ctx = {"bucket_name": dal.bucket_name, "operation_id": operation_id, "service": "S3_API"}
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Lifecycle_Operations_Start",
                 "Data_Artifacts": {
-                    "bucket_name": dal.bucket_name,
-                    "operation_id": operation_id,
+                    **base_ctx,
                     "timestamp": timestamp,
-                    "action": "lifecycle_operations_start",
-                    "service": "S3_API"
+                    "action": "lifecycle_operations_start"
                 }
             }))
             
             try:
                 # Step 1: Upload sample objects (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "Upload_Objects",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "action": "upload_objects_start",
-                        "service": "S3_API"
-                    }
-                }))
-                
+                step_start = time.perf_counter()
                 upload_results = dal.upload_sample_objects(operation_id, timestamp)
                 objects_created = upload_results.get('objects_created', 0)
-                
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "Upload_Objects_Complete",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "objects_created": objects_created,
-                        "action": "upload_objects_complete",
-                        "service": "S3_API"
-                    }
-                }))
+                steps = [{"step": "upload_objects", "duration_ms": _elapsed_ms(step_start), "count": objects_created}]
                 
                 # Step 2: List objects in the bucket (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "List_Objects",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "action": "list_objects_start",
-                        "service": "S3_API"
-                    }
-                }))
-                
+                step_start = time.perf_counter()
                 list_results = dal.list_bucket_objects(operation_id)
                 object_count = list_results.get('object_count', 0)
-                
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "List_Objects_Complete",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "object_count": object_count,
-                        "action": "list_objects_complete",
-                        "service": "S3_API"
-                    }
-                }))
+                steps.append({"step": "list_objects", "duration_ms": _elapsed_ms(step_start), "count": object_count})
                 
                 # Step 3: Delete the objects we created (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "Delete_Objects",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "action": "delete_objects_start",
-                        "service": "S3_API"
-                    }
-                }))
-                
-                delete_results = dal.delete_bucket_objects(operation_id)
+                step_start = time.perf_counter()
+                uploaded_keys = [op['key'] for op in upload_results.get('operations', []) if op['status'] == 'success']
+                delete_results = dal.batch_delete_objects(uploaded_keys)
                 objects_deleted = delete_results.get('objects_deleted', 0)
+                steps.append({"step": "delete_objects", "duration_ms": _elapsed_ms(step_start), "count": objects_deleted})
                 
-                logger.info(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "Delete_Objects_Complete",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "objects_deleted": objects_deleted,
-                        "action": "delete_objects_complete",
-                        "service": "S3_API"
-                    }
-                }))
-                
-                logger.info(safe_json_serialize({
+                # One summary record for the whole lifecycle instead of a start/complete pair per step
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Lifecycle_Operations_Complete",
                     "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
+                        **base_ctx,
                         "objects_created": objects_created,
+                        "object_count": object_count,
                         "objects_deleted": objects_deleted,
-                        "action": "lifecycle_operations_complete",
-                        "service": "S3_API"
+                        "steps": steps,
+                        "action": "lifecycle_operations_complete"
                     }
                 }))
                 
@@ -216,22 +211,11 @@ def perform_s3_operations():
                     'objects_deleted': objects_deleted
                 }
                 
-            except Exception as e:
-                logger.error(safe_json_serialize({
-                    "Data_Source": "S3_Operations",
-                    "Data_Target": "Lifecycle_Operations_Error",
-                    "Data_Artifacts": {
-                        "bucket_name": dal.bucket_name,
-                        "operation_id": operation_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "action": "lifecycle_operations_error",
-                        "service": "S3_API"
-                    }
-                }))
+            except Exception:
+                logger.exception("S3 Lifecycle_Operations_Error - bucket=%s operation_id=%s", dal.bucket_name, operation_id)
                 raise
         else:
-            logger.error(safe_json_serialize({
+            logger.error(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Bucket_Setup_Error",
                 "Data_Artifacts": {
@@ -247,7 +231,7 @@ def perform_s3_operations():
             }
             
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "S3_Operations_Error",
             "Data_Artifacts": {
@@ -270,35 +254,21 @@ def perform_api_operations():
     """
     try:
         # Create DAL instance
-        dal = APIDAL()
+        dal = _get_api_dal()
         
         # Round-robin through API endpoints
-        api_endpoints = [
-            "https://jsonplaceholder.typicode.com/posts/1",
-            "https://jsonplaceholder.typicode.com/posts/2", 
-            "https://jsonplaceholder.typicode.com/posts/3"
-        ]
-        endpoint_index = (int(time.time()) % len(api_endpoints))
-        endpoint = api_endpoints[endpoint_index]
+        endpoint_index = next(_API_ROUND_ROBIN)
+        endpoint = _API_ENDPOINTS[endpoint_index]
         
         # Add execution tag for API URL
         add_execution_tag("api_url", endpoint)
         
-        logger.info(safe_json_serialize({
-            "Data_Source": "Lambda_Handler",
-            "Data_Target": "API_Operations",
-            "Data_Artifacts": {
-                "endpoint": endpoint,
-                "round_robin_index": endpoint_index,
-                "action": "api_operations_start",
-                "service": "JSONPlaceholder_API"
-            }
-        }))
+        logger.info(_API_START_LOG, endpoint, endpoint_index)
         
         # Make the API call (wrapped service call)
         response = dal.fetch_data(endpoint)
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "API_Operations",
             "Data_Target": "API_Call_Complete",
             "Data_Artifacts": {
@@ -321,7 +291,7 @@ def perform_api_operations():
         }
         
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "API_Operations",
             "Data_Target": "API_Error",
             "Data_Artifacts": {
@@ -347,185 +317,71 @@ def perform_database_operations(table_name=None):
         dal = DynamoDBDAL(table_name)
         
         # Add execution tags for database and table
-        add_execution_tag("database", "DynamoDB")
-        add_execution_tag("database_table", dal.table_name)
+        add_execution_tags({"database": "DynamoDB", "database_table": dal.table_name})
         
-        logger.info(safe_json_serialize({
-            "Data_Source": "Lambda_Handler",
-            "Data_Target": "Database_Operations",
-            "Data_Artifacts": {
-                "table_name": dal.table_name,
-                "aws_service": "DynamoDB",
-                "action": "database_operations_start",
-                "service": "DynamoDB_API"
-            }
-        }))
+        logger.info(_DATABASE_START_LOG, dal.table_name)
         
         # Ensure table exists
         table_ready = dal.ensure_table_exists()
         
         if table_ready:
             # Generate unique item ID
-            item_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            item_id = os.urandom(16).hex()
+            timestamp = datetime.now(timezone.utc).isoformat()
+            
+            # Identity fields shared by every record of this CRUD cycle
+            base_ctx = {"table_name": dal.table_name, "item_id": item_id, "service": "DynamoDB_API"}
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "Database_Operations",
                 "Data_Target": "CRUD_Operations_Start",
                 "Data_Artifacts": {
-                    "table_name": dal.table_name,
-                    "item_id": item_id,
+                    **base_ctx,
                     "timestamp": timestamp,
-                    "action": "crud_operations_start",
-                    "service": "DynamoDB_API"
+                    "action": "crud_operations_start"
                 }
             }))
             
             try:
-                # Step 1: Create item (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Create_Item",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "create_item_start",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
+                # Step 1: Upsert item (wrapped service call); UpdateItem creates it, so no separate PutItem
+                step_start = time.perf_counter()
                 item_data = {
-                    'id': {'S': item_id},
-                    'data': {'S': 'Sample data'},
-                    'timestamp': {'S': timestamp},
-                    'status': {'S': 'active'}
-                }
-                create_response = dal.create_item(item_data)
-                
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Create_Item_Complete",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "create_item_complete",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                # Step 2: Read item (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Read_Item",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "read_item_start",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                read_response = dal.read_item(item_id)
-                
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Read_Item_Complete",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "read_item_complete",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                # Step 3: Update item (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Update_Item",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "update_item_start",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                updates = {
+                    'data': 'Sample data',
+                    'timestamp': timestamp,
                     'status': 'updated',
                     'updated_at': timestamp
                 }
-                update_response = dal.update_item(item_id, updates)
+                dal.update_item(item_id, item_data)
+                steps = [{"step": "upsert_item", "duration_ms": _elapsed_ms(step_start)}]
                 
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Update_Item_Complete",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "update_item_complete",
-                        "service": "DynamoDB_API"
-                    }
-                }))
+                # Step 2: Delete item (wrapped service call); ALL_OLD returns the item, standing in for a read
+                step_start = time.perf_counter()
+                delete_response = dal.delete_item(item_id, return_old=True)
+                steps.append({"step": "delete_item", "duration_ms": _elapsed_ms(step_start), "item_found": 'Attributes' in delete_response})
                 
-                # Step 4: Delete item (wrapped service call)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Delete_Item",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "delete_item_start",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                delete_response = dal.delete_item(item_id)
-                
-                logger.info(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "Delete_Item_Complete",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "action": "delete_item_complete",
-                        "service": "DynamoDB_API"
-                    }
-                }))
-                
-                logger.info(safe_json_serialize({
+                # One summary record for the whole CRUD cycle instead of a start/complete pair per step
+                logger.info(LazyJSON({
                     "Data_Source": "Database_Operations",
                     "Data_Target": "CRUD_Operations_Complete",
                     "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "operations_count": 4,
-                        "action": "crud_operations_complete",
-                        "service": "DynamoDB_API"
+                        **base_ctx,
+                        "operations_count": len(steps),
+                        "steps": steps,
+                        "action": "crud_operations_complete"
                     }
                 }))
                 
                 return {
                     'table_used': dal.table_name,
-                    'operations_count': 4,
+                    'operations_count': len(steps),
                     'item_id': item_id
                 }
                 
-            except Exception as e:
-                logger.error(safe_json_serialize({
-                    "Data_Source": "Database_Operations",
-                    "Data_Target": "CRUD_Operations_Error",
-                    "Data_Artifacts": {
-                        "table_name": dal.table_name,
-                        "item_id": item_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "action": "crud_operations_error",
-                        "service": "DynamoDB_API"
-                    }
-                }))
+            except Exception:
+                logger.exception("DynamoDB CRUD_Operations_Error - table=%s item_id=%s", dal.table_name, item_id)
                 raise
         else:
-            logger.error(safe_json_serialize({
+            logger.error(LazyJSON({
                 "Data_Source": "Database_Operations",
                 "Data_Target": "Table_Setup_Error",
                 "Data_Artifacts": {
@@ -541,7 +397,7 @@ def perform_database_operations(table_name=None):
             }
             
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "Database_Operations",
             "Data_Target": "Database_Operations_Error",
             "Data_Artifacts": {
@@ -557,6 +413,27 @@ def perform_database_operations(table_name=None):
             'error': str(e)
         }
 
+def perform_ephemeral_database_operations():
+    """
+    Example: Build the demo item without persisting it, for events with mode 'ephemeral'.
+    The item is well under Lambda's response size limit, so it is returned directly
+    instead of taking DynamoDB round trips to write and delete it again.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    item_id = os.urandom(16).hex()
+    return {
+        'mode': 'ephemeral',
+        'operations_count': 0,
+        'item_id': item_id,
+        'item': {
+            'id': item_id,
+            'data': 'Sample data',
+            'timestamp': timestamp,
+            'status': 'updated',
+            'updated_at': timestamp
+        }
+    }
+
 @timeout(30)  # 30 second timeout for RDS operations
 def perform_rds_operations():
     """
@@ -568,20 +445,9 @@ def perform_rds_operations():
         dal = PostgreSQLDAL()
         
         # Add execution tags for database and table
-        add_execution_tag("database", "RDS_PostgreSQL")
-        add_execution_tag("database_table", dal.table_name)
+        add_execution_tags({"database": "RDS_PostgreSQL", "database_table": dal.table_name})
         
-        logger.info(safe_json_serialize({
-            "Data_Source": "Lambda_Handler",
-            "Data_Target": "RDS_Operations",
-            "Data_Artifacts": {
-                "database_type": "RDS_PostgreSQL",
-                "table_name": dal.table_name,
-                "aws_service": "RDS",
-                "action": "rds_operations_start",
-                "service": "RDS_PostgreSQL_API"
-            }
-        }))
+        logger.info(_RDS_START_LOG, dal.table_name)
         
         # Quick check if RDS is accessible (fail fast)
         if not dal.connection_available:
@@ -599,9 +465,9 @@ def perform_rds_operations():
         if table_ready:
             # Generate unique user ID
             user_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            timestamp = datetime.now(timezone.utc).isoformat()
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "RDS_Operations",
                 "Data_Target": "CRUD_Operations_Start",
                 "Data_Artifacts": {
@@ -616,16 +482,7 @@ def perform_rds_operations():
             
             try:
                 # Step 1: Insert operations (wrapped service calls)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "RDS_Operations",
-                    "Data_Target": "Insert_Operations",
-                    "Data_Artifacts": {
-                        "database_type": "RDS_PostgreSQL",
-                        "table_name": dal.table_name,
-                        "action": "insert_operations_start",
-                        "service": "RDS_PostgreSQL_API"
-                    }
-                }))
+                step_start = time.perf_counter()
                 
                 # Insert user
                 user_data = {
@@ -659,7 +516,7 @@ def perform_rds_operations():
                 }
                 create_order_response = dal.insert_order(order_data)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "RDS_Operations",
                     "Data_Target": "Insert_Operations_Complete",
                     "Data_Artifacts": {
@@ -669,26 +526,18 @@ def perform_rds_operations():
                         "user_id": user_id,
                         "product_id": product_id,
                         "order_id": order_id,
+                        "duration_ms": _elapsed_ms(step_start),
                         "action": "insert_operations_complete",
                         "service": "RDS_PostgreSQL_API"
                     }
                 }))
                 
                 # Step 2: Read operations (wrapped service calls)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "RDS_Operations",
-                    "Data_Target": "Read_Operations",
-                    "Data_Artifacts": {
-                        "database_type": "RDS_PostgreSQL",
-                        "table_name": dal.table_name,
-                        "action": "read_operations_start",
-                        "service": "RDS_PostgreSQL_API"
-                    }
-                }))
+                step_start = time.perf_counter()
                 
                 read_user_response = dal.read_user(user_id)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "RDS_Operations",
                     "Data_Target": "Read_Operations_Complete",
                     "Data_Artifacts": {
@@ -696,22 +545,14 @@ def perform_rds_operations():
                         "table_name": dal.table_name,
                         "user_id": user_id,
                         "user_found": read_user_response.get('user_found', False),
+                        "duration_ms": _elapsed_ms(step_start),
                         "action": "read_operations_complete",
                         "service": "RDS_PostgreSQL_API"
                     }
                 }))
                 
                 # Step 3: Update operations (wrapped service calls)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "RDS_Operations",
-                    "Data_Target": "Update_Operations",
-                    "Data_Artifacts": {
-                        "database_type": "RDS_PostgreSQL",
-                        "table_name": dal.table_name,
-                        "action": "update_operations_start",
-                        "service": "RDS_PostgreSQL_API"
-                    }
-                }))
+                step_start = time.perf_counter()
                 
                 # Update user
                 user_updates = {
@@ -731,7 +572,7 @@ def perform_rds_operations():
                 # Update order status
                 update_order_response = dal.update_order_status(order_id, 'processing')
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "RDS_Operations",
                     "Data_Target": "Update_Operations_Complete",
                     "Data_Artifacts": {
@@ -741,22 +582,14 @@ def perform_rds_operations():
                         "user_id": user_id,
                         "product_id": product_id,
                         "order_id": order_id,
+                        "duration_ms": _elapsed_ms(step_start),
                         "action": "update_operations_complete",
                         "service": "RDS_PostgreSQL_API"
                     }
                 }))
                 
                 # Step 4: Delete operations (wrapped service calls)
-                logger.info(safe_json_serialize({
-                    "Data_Source": "RDS_Operations",
-                    "Data_Target": "Delete_Operations",
-                    "Data_Artifacts": {
-                        "database_type": "RDS_PostgreSQL",
-                        "table_name": dal.table_name,
-                        "action": "delete_operations_start",
-                        "service": "RDS_PostgreSQL_API"
-                    }
-                }))
+                step_start = time.perf_counter()
                 
                 # Delete order
                 delete_order_response = dal.delete_order(order_id)
@@ -767,7 +600,7 @@ def perform_rds_operations():
                 # Delete user
                 delete_user_response = dal.delete_user(user_id)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "RDS_Operations",
                     "Data_Target": "Delete_Operations_Complete",
                     "Data_Artifacts": {
@@ -777,12 +610,13 @@ def perform_rds_operations():
                         "user_id": user_id,
                         "product_id": product_id,
                         "order_id": order_id,
+                        "duration_ms": _elapsed_ms(step_start),
                         "action": "delete_operations_complete",
                         "service": "RDS_PostgreSQL_API"
                     }
                 }))
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "RDS_Operations",
                     "Data_Target": "CRUD_Operations_Complete",
                     "Data_Artifacts": {
@@ -811,23 +645,11 @@ def perform_rds_operations():
                     'status': 'success'
                 }
                 
-            except Exception as e:
-                logger.error(safe_json_serialize({
-                    "Data_Source": "RDS_Operations",
-                    "Data_Target": "CRUD_Operations_Error",
-                    "Data_Artifacts": {
-                        "database_type": "RDS_PostgreSQL",
-                        "table_name": dal.table_name,
-                        "user_id": user_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "action": "rds_crud_operations_error",
-                        "service": "RDS_PostgreSQL_API"
-                    }
-                }))
+            except Exception:
+                logger.exception("RDS CRUD_Operations_Error - table=%s user_id=%s", dal.table_name, user_id)
                 raise
         else:
-            logger.error(safe_json_serialize({
+            logger.error(LazyJSON({
                 "Data_Source": "RDS_Operations",
                 "Data_Target": "Table_Setup_Error",
                 "Data_Artifacts": {
@@ -845,7 +667,7 @@ def perform_rds_operations():
             }
             
     except TimeoutError as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "RDS_Operations",
             "Data_Target": "RDS_Operations_Timeout",
             "Data_Artifacts": {
@@ -863,7 +685,7 @@ def perform_rds_operations():
             'error': str(e)
         }
     except Exception as e:
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "RDS_Operations",
             "Data_Target": "RDS_Operations_Error",
             "Data_Artifacts": {
@@ -903,16 +725,18 @@ def lambda_handler(event, context):
             'rds_operations': True
         })
 
-        # Log the incoming event
-        logger.info(safe_json_serialize({
+        # Log the incoming event's shape; the full (capped) payload only at DEBUG
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Event",
             "Data_Target": "Lambda_Handler",
             "Data_Artifacts": {
-                "event": event,
+                "event_keys": list(event) if isinstance(event, dict) else type(event).__name__,
                 "actions": actions,
                 "request_id": context.aws_request_id
             }
         }))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(capped_json_serialize({"event": event, "request_id": context.aws_request_id}))
         
         # Initialize response data
         api_data = {'skipped': True, 'reason': 'api_operations disabled'}
@@ -920,10 +744,36 @@ def lambda_handler(event, context):
         db_data = {'skipped': True, 'reason': 'database_operations disabled'}
         rds_data = {'skipped': True, 'reason': 'rds_operations disabled'}
         
+        # Start the API, S3 and DynamoDB operations concurrently
+        api_future = _submit(perform_api_operations) if actions.get('api_operations', True) else None
+        s3_future = _submit(perform_s3_operations) if actions.get('s3_operations', True) else None
+        db_future = None
+        if actions.get('database_operations', True):
+            if event.get('mode') == 'ephemeral':
+                # Small demo payload: hand it back in the response, skipping DynamoDB
+                db_data = perform_ephemeral_database_operations()
+            else:
+                db_future = _submit(perform_database_operations)
+        
+        # RDS PostgreSQL operations
+        if actions.get('rds_operations', True):
+            try:
+                rds_data = perform_rds_operations()
+            except TimeoutError as e:
+                add_programmatic_error("RDS_TIMEOUT_FAILED", str(e), {
+                    "error_type": type(e).__name__
+                })
+                rds_data = {'error': str(e), 'timeout': True}
+            except Exception as e:
+                add_programmatic_error("RDS_OPERATION_FAILED", str(e), {
+                    "error_type": type(e).__name__
+                })
+                rds_data = {'error': str(e)}
+        
         # API calls
-        if actions.get('api_operations', True):
+        if api_future is not None:
             try:
-                api_data = perform_api_operations()
+                api_data = api_future.result()
             except Exception as e:
                 add_programmatic_error("API_OPERATION_FAILED", str(e), {
                     "error_type": type(e).__name__
@@ -931,9 +781,9 @@ def lambda_handler(event, context):
                 api_data = {'error': str(e)}
         
         # S3 operations 
-        if actions.get('s3_operations', True):
+        if s3_future is not None:
             try:
-                s3_data = perform_s3_operations()
+                s3_data = s3_future.result()
             except Exception as e:
                 add_programmatic_error("S3_OPERATION_FAILED", str(e), {
                     "error_type": type(e).__name__
@@ -941,30 +791,15 @@ def lambda_handler(event, context):
                 s3_data = {'error': str(e)}
         
         # DynamoDB operations
-        if actions.get('database_operations', True):
+        if db_future is not None:
             try:
-                db_data = perform_database_operations()
+                db_data = db_future.result()
             except Exception as e:
                 add_programmatic_error("DATABASE_OPERATION_FAILED", str(e), {
                     "error_type": type(e).__name__
                 })
                 db_data = {'error': str(e)}
         
-        # RDS PostgreSQL operations
-        if actions.get('rds_operations', True):
-            try:
-                rds_data = perform_rds_operations()
-            except TimeoutError as e:
-                add_programmatic_error("RDS_TIMEOUT_FAILED", str(e), {
-                    "error_type": type(e).__name__
-                })
-                rds_data = {'error': str(e), 'timeout': True}
-            except Exception as e:
-                add_programmatic_error("RDS_OPERATION_FAILED", str(e), {
-                    "error_type": type(e).__name__
-                })
-                rds_data = {'error': str(e)}
-        
         # Simulate some processing
         result = None
         if 'data' in event:
@@ -976,7 +811,7 @@ def lambda_handler(event, context):
         # Return success response
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': safe_json_serialize({
                 'message': 'Lambda function executed successfully',
                 'api_data': api_data,
                 's3_data': s3_data,
@@ -990,7 +825,7 @@ def lambda_handler(event, context):
     except requests.RequestException as e:
         # Wrap HTTP errors with Lumigo programmatic errors
         error_message = f"HTTP request failed: {str(e)}"
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "HTTP_Request",
             "Data_Target": "Error_Handling",
             "Data_Artifacts": {
@@ -1003,18 +838,12 @@ def lambda_handler(event, context):
             "error_code": getattr(e.response, 'status_code', 'unknown') if hasattr(e, 'response') else 'unknown'
         })
         
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': error_message,
-                'request_id': context.aws_request_id
-            })
-        }
+        return _error_response(500, error_message, context.aws_request_id)
         
     except Exception as e:
         # Wrap general errors with Lumigo programmatic errors
         error_message = f"Lambda execution failed: {str(e)}"
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Execution",
             "Data_Target": "Error_Handling",
             "Data_Artifacts": {
@@ -1031,13 +860,9 @@ def lambda_handler(event, context):
             "request_id": context.aws_request_id
         })
         
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': error_message,
-                'request_id': context.aws_request_id
-            })
-        }
+        return _error_response(500, error_message, context.aws_request_id)
+    finally:
+        _LOG_HANDLER.flush()
 
 # =============================================================================
 # LOCAL TESTING SECTION
@@ -0,0 +1,153 @@
+import json
+import functools
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when the wheel is unavailable
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # Optional middle tier between orjson and stdlib json
+    ujson = None
+
+# orjson encodes datetimes natively; naive ones are treated as UTC like the rest of this code
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC if orjson is not None else 0
+
+# Buffered handler hands records to the runtime's handler once this many are pending
+LOG_BUFFER_RECORDS = 64
+
+# ...or once the oldest pending record has waited this long (seconds)
+LOG_BUFFER_SECONDS = 1.0
+
+# Upper bound for log lines that embed caller-supplied data
+MAX_LOG_CHARS = 4096
+
+def _datetime_to_iso(obj):
+    """
+    ISO-format a datetime, treating naive values as UTC.
+    """
+    if obj.tzinfo is None:
+        obj = obj.replace(tzinfo=timezone.utc)
+    return obj.isoformat()
+
+def _default_serializer(obj):
+    """
+    Fallback for values the JSON encoder cannot handle natively.
+    """
+    if isinstance(obj, datetime):
+        return _datetime_to_iso(obj)
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
+# Stdlib encoder with orjson's compact separators, so every path emits the same shape
+_stdlib_dumps = functools.partial(json.dumps, default=_default_serializer, separators=(',', ':'))
+
+def _fallback_dumps(obj):
+    """
+    Encode with ujson when installed, otherwise (or if ujson rejects the input) with stdlib json.
+    """
+    if ujson is not None:
+        try:
+            return ujson.dumps(obj, default=_default_serializer, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            pass
+    return _stdlib_dumps(obj)
+
+def safe_json_serialize(obj):
+    """
+    Safely serialize objects that may contain datetime or other non-JSON serializable types.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default_serializer, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson rejects a few inputs json accepts, e.g. integers wider than 64 bits
+            pass
+    return _fallback_dumps(obj)
+
+class LazyJSON:
+    """
+    Log message that carries a structured payload and serializes it only when
+    a handler formats the record, so suppressed levels never pay for encoding.
+    """
+    __slots__ = ('payload',)
+    
+    def __init__(self, payload):
+        self.payload = payload
+    
+    def __str__(self):
+        return safe_json_serialize(self.payload)
+
+def capped_json_serialize(obj, max_chars=MAX_LOG_CHARS):
+    """
+    Serialize like safe_json_serialize, truncating output longer than max_chars.
+    """
+    serialized = safe_json_serialize(obj)
+    if len(serialized) <= max_chars:
+        return serialized
+    return f"{serialized[:max_chars]}...<truncated {len(serialized) - max_chars} chars>"
+
+def response_metadata(response, key='RequestId'):
+    """
+    Read a field from a boto3 response's ResponseMetadata, or 'unknown' if absent.
+    """
+    try:
+        return response['ResponseMetadata'][key]
+    except (KeyError, TypeError):
+        return 'unknown'
+
+class _BufferedHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that passes each pending record to every one of targets, bounds how long
+    a record can wait, and renders messages as they are logged so a buffered record shows
+    its arguments (LazyJSON payloads included) as they were at the logging call.
+    """
+    def __init__(self, capacity, targets, max_age=LOG_BUFFER_SECONDS):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=targets[0])
+        self.targets = targets
+        self.max_age = max_age
+    
+    def emit(self, record):
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        super().emit(record)
+    
+    def shouldFlush(self, record):
+        # emit() has already appended record, so the buffer is never empty here
+        return (super().shouldFlush(record)
+                or record.created - self.buffer[0].created >= self.max_age)
+    
+    def flush(self):
+        with self.lock:
+            try:
+                for record in self.buffer:
+                    for target in self.targets:
+                        target.handle(record)
+            finally:
+                self.buffer.clear()
+
+def install_buffered_handler(target_logger, capacity=LOG_BUFFER_RECORDS, max_age=LOG_BUFFER_SECONDS):
+    """
+    Put a buffering handler in front of all of target_logger's existing (runtime) handlers so
+    records are passed on in batches: when capacity records are pending, when the oldest has
+    waited max_age seconds, on any WARNING or above, or on flush(). The runtime handlers still
+    do the writing, so their formatting and framing are kept.
+    """
+    targets = list(target_logger.handlers)
+    for target in targets:
+        target_logger.removeHandler(target)
+    if not targets:
+        # Local runs have no runtime handler; write to stderr like logging.basicConfig would
+        targets.append(logging.StreamHandler())
+    handler = _BufferedHandler(capacity, targets, max_age)
+    target_logger.addHandler(handler)
+    return handler
@@ -0,0 +1,8 @@
+from lumigo_tracer import add_execution_tag
+
+def add_execution_tags(tags):
+    """
+    Add several Lumigo execution tags from a mapping of tag name to value.
+    """
+    for key, value in tags.items():
+        add_execution_tag(key, value)
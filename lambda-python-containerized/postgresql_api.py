@@ -1,16 +1,31 @@
 import os
+import functools
 import logging
 import boto3
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 import random
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from lumigo_tracer import add_execution_tag, lumigo_tracer
+from lumigo_tracer import lumigo_tracer
+from lumigo_utils import add_execution_tags
 
 # Configure logging
 logger = logging.getLogger()
 
+# Connection settings are read once per container; changing them needs a new container,
+# which Lambda does on every configuration update anyway
+_RDS_DATABASE_NAME = os.environ.get('RDS_DATABASE_NAME', 'lumigo_test')
+_RDS_HOST = os.environ.get('RDS_HOST', 'localhost')
+_RDS_PORT = int(os.environ.get('RDS_PORT', '5432'))
+_RDS_USERNAME = os.environ.get('RDS_USERNAME', 'lumigo_admin')
+_RDS_PASSWORD = os.environ.get('RDS_PASSWORD', 'LumigoTest123!')
+
+@functools.lru_cache(maxsize=1)
+def _get_rds():
+    """Return the RDS client shared by every PostgreSQLDAL in this container."""
+    return boto3.client('rds')
+
 
 
 class PostgreSQLDAL:
@@ -21,11 +36,11 @@ class PostgreSQLDAL:
     
     def __init__(self, table_name="users"):
         self.table_name = table_name
-        self.database_name = os.environ.get('RDS_DATABASE_NAME', 'lumigo_test')
-        self.host = os.environ.get('RDS_HOST', 'localhost')
-        self.port = int(os.environ.get('RDS_PORT', '5432'))
-        self.username = os.environ.get('RDS_USERNAME', 'lumigo_admin')
-        self.password = os.environ.get('RDS_PASSWORD', 'LumigoTest123!')
+        self.database_name = _RDS_DATABASE_NAME
+        self.host = _RDS_HOST
+        self.port = _RDS_PORT
+        self.username = _RDS_USERNAME
+        self.password = _RDS_PASSWORD
         
         self.connection_available = False
         self.connection = None
@@ -33,8 +48,7 @@ class PostgreSQLDAL:
         # Try to get RDS endpoint from environment or AWS
         try:
             # Always try to get RDS endpoint from AWS first
-            rds_client = boto3.client('rds')
-            response = rds_client.describe_db_instances(
+            response = _get_rds().describe_db_instances(
                 DBInstanceIdentifier='lumigo-test-postgres'
             )
             if response['DBInstances']:
@@ -42,16 +56,16 @@ class PostgreSQLDAL:
                 if instance['DBInstanceStatus'] == 'available':
                     self.host = instance['Endpoint']['Address']
                     self.connection_available = True
-                    logger.info(f"✅ RDS PostgreSQL endpoint found: {self.host}")
+                    logger.info("✅ RDS PostgreSQL endpoint found: %s", self.host)
                 else:
-                    logger.warning(f"⚠️  RDS instance status: {instance['DBInstanceStatus']}")
+                    logger.warning("⚠️  RDS instance status: %s", instance['DBInstanceStatus'])
                     # Fall back to environment variables if RDS not available
                     if self.host and self.host != 'localhost':
                         self.connection_available = True
             else:
                 logger.warning("⚠️  RDS instance not found, using simulation mode")
         except Exception as e:
-            logger.warning(f"⚠️  Could not get RDS endpoint: {str(e)}, using simulation mode")
+            logger.warning("⚠️  Could not get RDS endpoint: %s, using simulation mode", e)
             # Fall back to environment variables if RDS discovery fails
             if self.host and self.host != 'localhost':
                 self.connection_available = True
@@ -64,7 +78,7 @@ class PostgreSQLDAL:
             
         try:
             if self.connection is None or self.connection.closed:
-                logger.info(f"🔌 Connecting to PostgreSQL: {self.host}:{self.port}/{self.database_name}")
+                logger.info("🔌 Connecting to PostgreSQL: %s:%s/%s", self.host, self.port, self.database_name)
                 self.connection = psycopg2.connect(
                     host=self.host,
                     port=self.port,
@@ -77,7 +91,7 @@ class PostgreSQLDAL:
                 logger.info("✅ Database connection established")
             return self.connection
         except Exception as e:
-            logger.error(f"❌ Database connection failed: {str(e)}")
+            logger.error("❌ Database connection failed: %s", e)
             return None
     
     def ensure_table_exists(self):
@@ -138,11 +152,11 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Tables 'users', 'products', 'orders' are ready")
+            logger.info("✅ Tables 'users', 'products', 'orders' are ready")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to ensure tables exist: {str(e)}")
+            logger.error("❌ Failed to ensure tables exist: %s", e)
             return False
     
     @lumigo_tracer()
@@ -163,7 +177,7 @@ class PostgreSQLDAL:
             
             if not self.connection_available:
                 # Simulate INSERT operation
-                logger.info(f"📝 Simulating INSERT into {self.table_name}")
+                logger.info("📝 Simulating INSERT into %s", self.table_name)
                 return {
                     'affected_rows': 1,
                     'user_id': user_id,
@@ -182,11 +196,13 @@ class PostgreSQLDAL:
                 }
             
             # Add Lumigo execution tags for PostgreSQL operation
-            add_execution_tag("postgresql_operation", "INSERT")
-            add_execution_tag("postgresql_table", "users")
-            add_execution_tag("postgresql_user_id", user_id)
+            add_execution_tags({
+                "postgresql_operation": "INSERT",
+                "postgresql_table": "users",
+                "postgresql_user_id": user_id
+            })
             
-            logger.info(f"📝 Executing real INSERT into users table: {user_id}")
+            logger.info("📝 Executing real INSERT into users table: %s", user_id)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO users (id, username, email, status)
@@ -196,7 +212,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Created user: {user_id}")
+            logger.info("✅ Created user: %s", user_id)
             return {
                 'affected_rows': 1,
                 'user_id': user_id,
@@ -205,7 +221,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to create user: {str(e)}")
+            logger.error("❌ Failed to create user: %s", e)
             raise
     
     def insert_product(self, product_data):
@@ -226,7 +242,7 @@ class PostgreSQLDAL:
             
             if not self.connection_available:
                 # Simulate INSERT operation
-                logger.info(f"📝 Simulating INSERT into products table")
+                logger.info("📝 Simulating INSERT into products table")
                 return {
                     'affected_rows': 1,
                     'product_id': product_id,
@@ -245,9 +261,11 @@ class PostgreSQLDAL:
                 }
             
             # Add Lumigo execution tags for PostgreSQL operation
-            add_execution_tag("postgresql_operation", "INSERT")
-            add_execution_tag("postgresql_table", "products")
-            add_execution_tag("postgresql_product_id", product_id)
+            add_execution_tags({
+                "postgresql_operation": "INSERT",
+                "postgresql_table": "products",
+                "postgresql_product_id": product_id
+            })
             
             cursor = conn.cursor()
             cursor.execute("""
@@ -258,7 +276,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Created product: {product_id}")
+            logger.info("✅ Created product: %s", product_id)
             return {
                 'affected_rows': 1,
                 'product_id': product_id,
@@ -267,7 +285,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to insert product: {str(e)}")
+            logger.error("❌ Failed to insert product: %s", e)
             raise
     
     def insert_order(self, order_data):
@@ -287,7 +305,7 @@ class PostgreSQLDAL:
             
             if not self.connection_available:
                 # Simulate INSERT operation
-                logger.info(f"📝 Simulating INSERT into orders table")
+                logger.info("📝 Simulating INSERT into orders table")
                 return {
                     'affected_rows': 1,
                     'order_id': order_id,
@@ -314,7 +332,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Created order: {order_id}")
+            logger.info("✅ Created order: %s", order_id)
             return {
                 'affected_rows': 1,
                 'order_id': order_id,
@@ -323,7 +341,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to insert order: {str(e)}")
+            logger.error("❌ Failed to insert order: %s", e)
             raise
     
     @lumigo_tracer()
@@ -340,14 +358,14 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate SELECT operation
-                logger.info(f"📖 Simulating SELECT from {self.table_name}")
+                logger.info("📖 Simulating SELECT from %s", self.table_name)
                 return {
                     'user_found': True,
                     'user_data': {
                         'id': user_id,
                         'username': f'user_{random.randint(1000, 9999)}',
                         'email': f'user_{random.randint(1000, 9999)}@example.com',
-                        'created_at': datetime.utcnow().isoformat(),
+                        'created_at': datetime.now(timezone.utc).isoformat(),
                         'status': 'active'
                     },
                     'query_time': random.uniform(0.01, 0.05),
@@ -363,7 +381,7 @@ class PostgreSQLDAL:
                         'id': user_id,
                         'username': f'user_{random.randint(1000, 9999)}',
                         'email': f'user_{random.randint(1000, 9999)}@example.com',
-                        'created_at': datetime.utcnow().isoformat(),
+                        'created_at': datetime.now(timezone.utc).isoformat(),
                         'status': 'active'
                     },
                     'query_time': random.uniform(0.01, 0.05),
@@ -371,9 +389,11 @@ class PostgreSQLDAL:
                 }
             
             # Add Lumigo execution tags for PostgreSQL operation
-            add_execution_tag("postgresql_operation", "SELECT")
-            add_execution_tag("postgresql_table", "users")
-            add_execution_tag("postgresql_user_id", user_id)
+            add_execution_tags({
+                "postgresql_operation": "SELECT",
+                "postgresql_table": "users",
+                "postgresql_user_id": user_id
+            })
             
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             cursor.execute("""
@@ -387,7 +407,7 @@ class PostgreSQLDAL:
             if result:
                 user_data = dict(result)
                 user_data['created_at'] = user_data['created_at'].isoformat() if user_data['created_at'] else None
-                logger.info(f"✅ Found user: {user_id}")
+                logger.info("✅ Found user: %s", user_id)
                 return {
                     'user_found': True,
                     'user_data': user_data,
@@ -395,7 +415,7 @@ class PostgreSQLDAL:
                     'operation': 'SELECT'
                 }
             else:
-                logger.warning(f"⚠️  User not found: {user_id}")
+                logger.warning("⚠️  User not found: %s", user_id)
                 return {
                     'user_found': False,
                     'user_data': None,
@@ -404,7 +424,7 @@ class PostgreSQLDAL:
                 }
             
         except Exception as e:
-            logger.error(f"❌ Failed to read user: {str(e)}")
+            logger.error("❌ Failed to read user: %s", e)
             raise
     
     @lumigo_tracer()
@@ -422,7 +442,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate UPDATE operation
-                logger.info(f"📝 Simulating UPDATE in {self.table_name}")
+                logger.info("📝 Simulating UPDATE in %s", self.table_name)
                 return {
                     'affected_rows': 1,
                     'updated_fields': list(updates.keys()),
@@ -441,10 +461,12 @@ class PostgreSQLDAL:
                 }
             
             # Add Lumigo execution tags for PostgreSQL operation
-            add_execution_tag("postgresql_operation", "UPDATE")
-            add_execution_tag("postgresql_table", "users")
-            add_execution_tag("postgresql_user_id", user_id)
-            add_execution_tag("postgresql_updated_fields", ",".join(updates.keys()))
+            add_execution_tags({
+                "postgresql_operation": "UPDATE",
+                "postgresql_table": "users",
+                "postgresql_user_id": user_id,
+                "postgresql_updated_fields": ",".join(updates.keys())
+            })
             
             # Build dynamic UPDATE query
             set_clauses = []
@@ -474,7 +496,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Updated user: {user_id} ({affected_rows} rows affected)")
+            logger.info("✅ Updated user: %s (%s rows affected)", user_id, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'updated_fields': list(updates.keys()),
@@ -483,7 +505,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to update user: {str(e)}")
+            logger.error("❌ Failed to update user: %s", e)
             raise
     
     def update_product(self, product_id, updates):
@@ -500,7 +522,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate UPDATE operation
-                logger.info(f"📝 Simulating UPDATE in products table")
+                logger.info("📝 Simulating UPDATE in products table")
                 return {
                     'affected_rows': 1,
                     'updated_fields': list(updates.keys()),
@@ -547,7 +569,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Updated product: {product_id} ({affected_rows} rows affected)")
+            logger.info("✅ Updated product: %s (%s rows affected)", product_id, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'updated_fields': list(updates.keys()),
@@ -556,7 +578,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to update product: {str(e)}")
+            logger.error("❌ Failed to update product: %s", e)
             raise
     
     def update_order_status(self, order_id, new_status):
@@ -573,7 +595,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate UPDATE operation
-                logger.info(f"📝 Simulating UPDATE in orders table")
+                logger.info("📝 Simulating UPDATE in orders table")
                 return {
                     'affected_rows': 1,
                     'updated_fields': ['status'],
@@ -601,7 +623,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Updated order status: {order_id} -> {new_status} ({affected_rows} rows affected)")
+            logger.info("✅ Updated order status: %s -> %s (%s rows affected)", order_id, new_status, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'updated_fields': ['status'],
@@ -610,7 +632,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to update order status: {str(e)}")
+            logger.error("❌ Failed to update order status: %s", e)
             raise
     
     @lumigo_tracer()
@@ -627,7 +649,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate DELETE operation
-                logger.info(f"🗑️  Simulating DELETE from {self.table_name}")
+                logger.info("🗑️  Simulating DELETE from %s", self.table_name)
                 return {
                     'affected_rows': 1,
                     'deleted_user_id': user_id,
@@ -646,9 +668,11 @@ class PostgreSQLDAL:
                 }
             
             # Add Lumigo execution tags for PostgreSQL operation
-            add_execution_tag("postgresql_operation", "DELETE")
-            add_execution_tag("postgresql_table", "users")
-            add_execution_tag("postgresql_user_id", user_id)
+            add_execution_tags({
+                "postgresql_operation": "DELETE",
+                "postgresql_table": "users",
+                "postgresql_user_id": user_id
+            })
             
             cursor = conn.cursor()
             cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
@@ -657,7 +681,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Deleted user: {user_id} ({affected_rows} rows affected)")
+            logger.info("✅ Deleted user: %s (%s rows affected)", user_id, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'deleted_user_id': user_id,
@@ -666,7 +690,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to delete user: {str(e)}")
+            logger.error("❌ Failed to delete user: %s", e)
             raise
     
     def delete_product(self, product_id):
@@ -682,7 +706,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate DELETE operation
-                logger.info(f"🗑️  Simulating DELETE from products table")
+                logger.info("🗑️  Simulating DELETE from products table")
                 return {
                     'affected_rows': 1,
                     'deleted_product_id': product_id,
@@ -707,7 +731,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Deleted product: {product_id} ({affected_rows} rows affected)")
+            logger.info("✅ Deleted product: %s (%s rows affected)", product_id, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'deleted_product_id': product_id,
@@ -716,7 +740,7 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to delete product: {str(e)}")
+            logger.error("❌ Failed to delete product: %s", e)
             raise
     
     def delete_order(self, order_id):
@@ -732,7 +756,7 @@ class PostgreSQLDAL:
         try:
             if not self.connection_available:
                 # Simulate DELETE operation
-                logger.info(f"🗑️  Simulating DELETE from orders table")
+                logger.info("🗑️  Simulating DELETE from orders table")
                 return {
                     'affected_rows': 1,
                     'deleted_order_id': order_id,
@@ -757,7 +781,7 @@ class PostgreSQLDAL:
             conn.commit()
             cursor.close()
             
-            logger.info(f"✅ Deleted order: {order_id} ({affected_rows} rows affected)")
+            logger.info("✅ Deleted order: %s (%s rows affected)", order_id, affected_rows)
             return {
                 'affected_rows': affected_rows,
                 'deleted_order_id': order_id,
@@ -766,5 +790,5 @@ class PostgreSQLDAL:
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to delete order: {str(e)}")
+            logger.error("❌ Failed to delete order: %s", e)
             raise 
\ No newline at end of file
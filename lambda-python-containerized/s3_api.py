@@ -1,32 +1,75 @@
 import json
 import os
 import time
+import functools
+import itertools
 import logging
+import contextvars
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 import uuid
-from datetime import datetime
-from opentelemetry import trace
+
+from log_utils import LazyJSON, response_metadata
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Initialize S3 client
-s3_client = boto3.client('s3')
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_LIMIT = 1000
+
+# Every sample object lives under this parent prefix; one stable lifecycle rule expires them all
+_SAMPLE_PREFIX = 'sample-'
+_SAMPLE_EXPIRY_RULE_ID = 'expire-sample-objects'
+
+# Buckets known to carry the sample expiry rule; lets warm invocations skip the lifecycle round trips
+_EXPIRY_RULE_BUCKETS = set()
+
+# Upper bound on concurrent uploads from upload_sample_objects; the executor is reused across warm invocations
+_UPLOAD_MAX_WORKERS = 16
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=_UPLOAD_MAX_WORKERS)
+
+# Buckets confirmed usable in this container, keyed by the requested name; the value is the
+# bucket actually in use, which differs when create_bucket had to fall back to another name
+_VERIFIED_BUCKETS = {}
+
+# Round-robin bucket names, resolved once per container instead of per DAL instance
+_BUCKET_BASE = os.environ.get('S3_BUCKET_NAME', 'example-bucket')
+_S3_BUCKETS = (_BUCKET_BASE, f"{_BUCKET_BASE}-2", f"{_BUCKET_BASE}-3")
+_BUCKET_ROUND_ROBIN = itertools.cycle(range(len(_S3_BUCKETS)))
+
+# Keep pooled S3 connections alive between warm invocations; the pool is sized above
+# _UPLOAD_MAX_WORKERS so concurrent uploads never queue for a connection
+_S3_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# Region the Lambda runs in; fixed for the life of the container
+_REGION = os.environ.get('AWS_REGION')
 
-def safe_json_serialize(obj):
+@functools.lru_cache(maxsize=4)
+def _get_s3(region=None):
     """
-    Safely serialize objects that may contain datetime or other non-JSON serializable types.
+    Return the shared S3 client for a region, creating it on first use.
     """
-    def default_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return str(obj)
-    
-    return json.dumps(obj, default=default_serializer)
+    return boto3.client('s3', region_name=region, config=_S3_CONFIG)
+
+@functools.lru_cache(maxsize=1)
+def _get_sts():
+    """
+    Return the shared STS client, used to look up the account id for bucket naming.
+    """
+    return boto3.client('sts')
+
+def _forget_bucket(bucket_name):
+    """
+    Drop every verified entry that resolved to bucket_name.
+    """
+    for requested in [key for key, value in _VERIFIED_BUCKETS.items() if value == bucket_name]:
+        _VERIFIED_BUCKETS.pop(requested, None)
 
 class S3DAL:
     """
@@ -38,7 +81,7 @@ class S3DAL:
         """
         Initialize the DAL with a specific bucket name or use round-robin selection.
         """
-        self.s3 = boto3.client('s3')
+        self.s3 = _get_s3(_REGION)
         self.bucket_name = bucket_name or "example-bucket"
         self.round_robin_index = None
         if bucket_name:
@@ -46,15 +89,10 @@ class S3DAL:
             self.round_robin_index = None
         else:
             # Round-robin through S3 buckets
-            s3_buckets = [
-                os.environ.get('S3_BUCKET_NAME', 'example-bucket'),
-                os.environ.get('S3_BUCKET_NAME', 'example-bucket') + '-2',
-                os.environ.get('S3_BUCKET_NAME', 'example-bucket') + '-3'
-            ]
-            self.round_robin_index = (int(time.time()) % len(s3_buckets))
-            self.bucket_name = s3_buckets[self.round_robin_index]
+            self.round_robin_index = next(_BUCKET_ROUND_ROBIN)
+            self.bucket_name = _S3_BUCKETS[self.round_robin_index]
         
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "Lambda_Handler",
             "Data_Target": "S3_Operations",
             "Data_Artifacts": {
@@ -67,8 +105,23 @@ class S3DAL:
     def ensure_bucket_exists(self):
         """
         Check if S3 bucket exists and create it if needed.
+        Warm invocations reuse the earlier answer and skip HeadBucket.
         """
-        logger.info(safe_json_serialize({
+        requested = self.bucket_name
+        verified = _VERIFIED_BUCKETS.get(requested)
+        if verified is not None:
+            self.bucket_name = verified
+            return True
+        bucket_ready = self._verify_bucket()
+        if bucket_ready:
+            _VERIFIED_BUCKETS[requested] = self.bucket_name
+        return bucket_ready
+    
+    def _verify_bucket(self):
+        """
+        Probe the bucket with HeadBucket, creating it when missing or inaccessible.
+        """
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Check_Bucket_Exists",
             "Data_Artifacts": {
@@ -82,7 +135,7 @@ class S3DAL:
             try:
                 self.s3.head_bucket(Bucket=self.bucket_name)
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Bucket_Exists",
                     "Data_Artifacts": {
@@ -95,7 +148,7 @@ class S3DAL:
                 return True
                 
             except self.s3.exceptions.NoSuchBucket:
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Bucket_Not_Found",
                     "Data_Artifacts": {
@@ -110,10 +163,10 @@ class S3DAL:
             except self.s3.exceptions.ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == '403':
-                    logger.warning(f"⚠️  Access denied to bucket {self.bucket_name}, attempting to create new bucket")
+                    logger.warning("⚠️  Access denied to bucket %s, attempting to create new bucket", self.bucket_name)
                     return self.create_bucket()
                 else:
-                    logger.info(safe_json_serialize({
+                    logger.info(LazyJSON({
                         "Data_Source": "S3_Operations",
                         "Data_Target": "Check_Bucket_Error",
                         "Data_Artifacts": {
@@ -127,7 +180,7 @@ class S3DAL:
                     return self.create_bucket()
                     
             except Exception as e:
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Check_Bucket_Error",
                     "Data_Artifacts": {
@@ -142,7 +195,7 @@ class S3DAL:
                 return self.create_bucket()
                 
         except Exception as e:
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Ensure_Bucket_Error",
                 "Data_Artifacts": {
@@ -161,7 +214,7 @@ class S3DAL:
         Create an S3 bucket for demonstration purposes.
         Handles various error cases and tries alternative bucket names if needed.
         """
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Create_Bucket",
             "Data_Artifacts": {
@@ -173,8 +226,7 @@ class S3DAL:
         
         # Get AWS account ID for unique bucket naming
         try:
-            sts_client = boto3.client('sts')
-            account_id = sts_client.get_caller_identity()['Account']
+            account_id = _get_sts().get_caller_identity()['Account']
         except:
             account_id = "unknown"
         
@@ -189,12 +241,12 @@ class S3DAL:
         
         for bucket_name in bucket_names_to_try:
             try:
-                logger.info(f"🪣 Attempting to create bucket: {bucket_name}")
+                logger.info("🪣 Attempting to create bucket: %s", bucket_name)
                 
                 # Check if bucket already exists
                 try:
                     self.s3.head_bucket(Bucket=bucket_name)
-                    logger.info(f"✅ Bucket {bucket_name} already exists")
+                    logger.info("✅ Bucket %s already exists", bucket_name)
                     self.bucket_name = bucket_name
                     return True
                 except self.s3.exceptions.NoSuchBucket:
@@ -208,20 +260,20 @@ class S3DAL:
                 # Create the bucket
                 try:
                     self.s3.create_bucket(Bucket=bucket_name)
-                    logger.info(f"✅ Successfully created bucket: {bucket_name}")
+                    logger.info("✅ Successfully created bucket: %s", bucket_name)
                 except self.s3.exceptions.BucketAlreadyExists:
-                    logger.info(f"✅ Bucket {bucket_name} already exists (different account)")
+                    logger.info("✅ Bucket %s already exists (different account)", bucket_name)
                     self.bucket_name = bucket_name
                     return True
                 except self.s3.exceptions.BucketAlreadyOwnedByYou:
-                    logger.info(f"✅ Bucket {bucket_name} already owned by you")
+                    logger.info("✅ Bucket %s already owned by you", bucket_name)
                     self.bucket_name = bucket_name
                     return True
                 except Exception as e:
-                    logger.warning(f"⚠️  Failed to create bucket {bucket_name}: {str(e)}")
+                    logger.warning("⚠️  Failed to create bucket %s: %s", bucket_name, e)
                     continue
                 
-                logger.info(safe_json_serialize({
+                logger.info(LazyJSON({
                     "Data_Source": "S3_Operations",
                     "Data_Target": "Create_Bucket_Success",
                     "Data_Artifacts": {
@@ -236,20 +288,20 @@ class S3DAL:
                 return True
                 
             except self.s3.exceptions.BucketAlreadyExists:
-                logger.warning(f"⚠️  Bucket {bucket_name} already exists (different account)")
+                logger.warning("⚠️  Bucket %s already exists (different account)", bucket_name)
                 continue
                 
             except self.s3.exceptions.BucketAlreadyOwnedByYou:
-                logger.info(f"✅ Bucket {bucket_name} already owned by you")
+                logger.info("✅ Bucket %s already owned by you", bucket_name)
                 self.bucket_name = bucket_name
                 return True
                 
             except Exception as e:
-                logger.warning(f"⚠️  Failed to create bucket {bucket_name}: {str(e)}")
+                logger.warning("⚠️  Failed to create bucket %s: %s", bucket_name, e)
                 continue
         
         # If we get here, all bucket names failed
-        logger.error(safe_json_serialize({
+        logger.error(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Create_Bucket_Error",
             "Data_Artifacts": {
@@ -267,7 +319,7 @@ class S3DAL:
         """
         Upload an object to S3 bucket.
         """
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Upload_Object",
             "Data_Artifacts": {
@@ -288,7 +340,7 @@ class S3DAL:
                 ContentType=content_type
             )
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Upload_Object_Success",
                 "Data_Artifacts": {
@@ -306,7 +358,10 @@ class S3DAL:
             }
             
         except Exception as e:
-            logger.info(safe_json_serialize({
+            if isinstance(e, self.s3.exceptions.NoSuchBucket):
+                # Bucket vanished since it was verified; make the next invocation check again
+                _forget_bucket(self.bucket_name)
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Upload_Object_Error",
                 "Data_Artifacts": {
@@ -325,7 +380,7 @@ class S3DAL:
         """
         List objects in S3 bucket.
         """
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "List_Objects",
             "Data_Artifacts": {
@@ -342,20 +397,24 @@ class S3DAL:
                 Prefix=prefix
             )
             objects = response.get('Contents', [])
+            object_keys = [obj['Key'] for obj in objects]
+            
+            # Key listings grow with the prefix, so only dump them at DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(LazyJSON({"bucket_name": self.bucket_name, "objects": object_keys}))
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "List_Objects_Success",
                 "Data_Artifacts": {
                     "bucket_name": self.bucket_name,
                     "prefix": prefix,
                     "object_count": len(objects),
-                    "objects": [obj['Key'] for obj in objects],
                     "action": "list_objects_success",
                     "aws_service": "S3",
                     "response_metadata": {
-                        "request_id": response.get('ResponseMetadata', {}).get('RequestId', 'unknown'),
-                        "http_status_code": response.get('ResponseMetadata', {}).get('HTTPStatusCode', 'unknown')
+                        "request_id": response_metadata(response),
+                        "http_status_code": response_metadata(response, 'HTTPStatusCode')
                     }
                 }
             }))
@@ -363,12 +422,12 @@ class S3DAL:
             return {
                 'status': 'success',
                 'object_count': len(objects),
-                'objects': [obj['Key'] for obj in objects],
+                'objects': object_keys,
                 'bucket': self.bucket_name
             }
             
         except Exception as e:
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "List_Objects_Error",
                 "Data_Artifacts": {
@@ -387,7 +446,7 @@ class S3DAL:
         """
         Delete an object from S3 bucket.
         """
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Delete_Object",
             "Data_Artifacts": {
@@ -401,7 +460,7 @@ class S3DAL:
         try:
             response = self.s3.delete_object(Bucket=self.bucket_name, Key=key)
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Delete_Object_Success",
                 "Data_Artifacts": {
@@ -419,7 +478,7 @@ class S3DAL:
             }
             
         except Exception as e:
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Delete_Object_Error",
                 "Data_Artifacts": {
@@ -434,11 +493,64 @@ class S3DAL:
             
             raise
     
+    def batch_delete_objects(self, keys):
+        """
+        Delete objects from S3 bucket with DeleteObjects, up to 1000 keys per request.
+        """
+        operations = []
+        objects_deleted = 0
+        
+        for start in range(0, len(keys), _DELETE_BATCH_LIMIT):
+            chunk = keys[start:start + _DELETE_BATCH_LIMIT]
+            try:
+                response = self.s3.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+                )
+                # Quiet mode only reports failures
+                errors = {err['Key']: err.get('Message', err.get('Code')) for err in response.get('Errors', [])}
+            except Exception as e:
+                errors = {key: str(e) for key in chunk}
+            
+            for key in chunk:
+                if key in errors:
+                    operations.append({
+                        'operation': 'DELETE_OBJECT',
+                        'status': 'failed',
+                        'key': key,
+                        'error': errors[key]
+                    })
+                else:
+                    objects_deleted += 1
+                    operations.append({
+                        'operation': 'DELETE_OBJECT',
+                        'status': 'success',
+                        'key': key
+                    })
+        
+        logger.info(LazyJSON({
+            "Data_Source": "S3_Operations",
+            "Data_Target": "Batch_Delete_Complete",
+            "Data_Artifacts": {
+                "bucket_name": self.bucket_name,
+                "objects_deleted": objects_deleted,
+                "total_objects": len(keys),
+                "failed_deletions": len(keys) - objects_deleted,
+                "action": "batch_delete_complete",
+                "aws_service": "S3"
+            }
+        }))
+        
+        return {
+            'objects_deleted': objects_deleted,
+            'operations': operations
+        }
+    
     def upload_sample_objects(self, operation_id, timestamp):
         """
         Upload sample objects to S3 bucket.
         """
-        logger.info(safe_json_serialize({
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Upload_Sample_Objects",
             "Data_Artifacts": {
@@ -458,7 +570,8 @@ class S3DAL:
                     'message': 'Sample data 1',
                     'timestamp': timestamp,
                     'operation_id': operation_id
-                })
+                }).encode('utf-8'),
+                'content_type': 'application/json'
             },
             {
                 'key': f'sample-{operation_id}/data2.json',
@@ -467,41 +580,43 @@ class S3DAL:
                     'message': 'Sample data 2',
                     'timestamp': timestamp,
                     'operation_id': operation_id
-                })
+                }).encode('utf-8'),
+                'content_type': 'application/json'
             },
             {
                 'key': f'sample-{operation_id}/metadata.txt',
-                'content': f'Operation ID: {operation_id}\nTimestamp: {timestamp}\nBucket: {self.bucket_name}'
+                'content': f'Operation ID: {operation_id}\nTimestamp: {timestamp}\nBucket: {self.bucket_name}'.encode('utf-8'),
+                'content_type': 'text/plain'
             }
         ]
         
-        operations = []
-        objects_created = 0
-        
-        for obj in sample_objects:
+        def upload(obj):
             try:
-                result = self.upload_object(
-                    obj['key'], 
-                    obj['content'],
-                    'application/json' if obj['key'].endswith('.json') else 'text/plain'
-                )
-                
-                objects_created += 1
-                operations.append({
+                self.upload_object(obj['key'], obj['content'], obj['content_type'])
+                return {
                     'operation': 'UPLOAD_OBJECT',
                     'status': 'success',
                     'key': obj['key']
-                })
-                
+                }
             except Exception as e:
-                operations.append({
+                return {
                     'operation': 'UPLOAD_OBJECT',
                     'status': 'failed',
                     'key': obj['key'],
                     'error': str(e)
-                })
+                }
         
-        logger.info(safe_json_serialize({
+        # Uploads are independent and bound by S3 round trips, so run them side by side, each in
+        # a copy of this invocation's context so tracing from the upload stays attached to it;
+        # operations keep the order of sample_objects
+        futures = [
+            _UPLOAD_EXECUTOR.submit(contextvars.copy_context().run, upload, obj)
+            for obj in sample_objects
+        ]
+        operations = [future.result() for future in futures]
+        objects_created = sum(1 for op in operations if op['status'] == 'success')
+        
+        logger.info(LazyJSON({
             "Data_Source": "S3_Operations",
             "Data_Target": "Upload_Operation_Complete",
             "Data_Artifacts": {
@@ -522,6 +637,7 @@ class S3DAL:
     def list_bucket_objects(self, operation_id):
         """
         List objects in S3 bucket.
+        object_keys is None when the listing failed, so delete_bucket_objects falls back to listing itself.
         """
         try:
             result = self.list_objects(f'sample-{operation_id}/')
@@ -534,7 +650,8 @@ class S3DAL:
             
             return {
                 'operations': operations,
-                'object_count': result.get('object_count', 0)
+                'object_count': result.get('object_count', 0),
+                'object_keys': result.get('objects', [])
             }
             
         except Exception as e:
@@ -546,61 +663,49 @@ class S3DAL:
             
             return {
                 'operations': operations,
-                'object_count': 0
+                'object_count': 0,
+                'object_keys': None
             }
     
-    def delete_bucket_objects(self, operation_id):
+    def delete_bucket_objects(self, operation_id, keys=None, mode='sync'):
         """
-        Delete objects from S3 bucket.
+        Delete every object under the operation's prefix from S3 bucket.
+        Pass keys (e.g. list_bucket_objects' object_keys) to delete them without listing the prefix again.
+        With mode='lifecycle' nothing is deleted here; the bucket's sample expiry rule removes the
+        objects server-side instead.
         """
+        if mode == 'lifecycle':
+            return self.ensure_sample_expiry()
         try:
-            # First list objects to delete
-            list_result = self.list_objects(f'sample-{operation_id}/')
-            objects_to_delete = list_result.get('objects', [])
-            
-            logger.info(safe_json_serialize({
-                "Data_Source": "S3_Operations",
-                "Data_Target": "Delete_Objects_List",
-                "Data_Artifacts": {
-                    "bucket_name": self.bucket_name,
-                    "prefix": f'sample-{operation_id}/',
-                    "objects_to_delete": len(objects_to_delete),
-                    "object_keys": objects_to_delete,
-                    "action": "delete_objects_list",
-                    "operation_id": operation_id
-                }
-            }))
-            
+            prefix = f'sample-{operation_id}/'
             operations = []
             objects_deleted = 0
             
-            for obj_key in objects_to_delete:
-                try:
-                    result = self.delete_object(obj_key)
-                    
-                    objects_deleted += 1
-                    operations.append({
-                        'operation': 'DELETE_OBJECT',
-                        'status': 'success',
-                        'key': obj_key
-                    })
-                    
-                except Exception as e:
-                    operations.append({
-                        'operation': 'DELETE_OBJECT',
-                        'status': 'failed',
-                        'key': obj_key,
-                        'error': str(e)
-                    })
+            if keys is not None:
+                pages = [keys]
+            else:
+                # Delete page by page as the listing arrives: each page holds at most 1000 keys,
+                # which is exactly one DeleteObjects request, and no prefix is silently truncated
+                pages = (
+                    [obj['Key'] for obj in page.get('Contents', [])]
+                    for page in self.s3.get_paginator('list_objects_v2').paginate(Bucket=self.bucket_name, Prefix=prefix)
+                )
+            for page_keys in pages:
+                if not page_keys:
+                    continue
+                result = self.batch_delete_objects(page_keys)
+                objects_deleted += result['objects_deleted']
+                operations.extend(result['operations'])
             
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Delete_Operation_Complete",
                 "Data_Artifacts": {
                     "bucket_name": self.bucket_name,
+                    "prefix": prefix,
                     "objects_deleted": objects_deleted,
-                    "total_objects": len(objects_to_delete),
-                    "failed_deletions": len(objects_to_delete) - objects_deleted,
+                    "total_objects": len(operations),
+                    "failed_deletions": len(operations) - objects_deleted,
                     "action": "delete_operation_complete",
                     "operation_id": operation_id
                 }
@@ -612,7 +717,7 @@ class S3DAL:
             }
             
         except Exception as e:
-            logger.info(safe_json_serialize({
+            logger.info(LazyJSON({
                 "Data_Source": "S3_Operations",
                 "Data_Target": "Delete_Objects_Error",
                 "Data_Artifacts": {
@@ -634,4 +739,82 @@ class S3DAL:
             return {
                 'objects_deleted': 0,
                 'operations': operations
-            } 
\ No newline at end of file
+            } 
+    
+    def ensure_sample_expiry(self):
+        """
+        Make sure the bucket has the single lifecycle rule that expires every sample object one day
+        after upload. For prefixes too large to delete from Lambda: S3 removes the objects
+        server-side and this returns as soon as the rule is in place. The rule ID and prefix are
+        fixed, so the configuration is written at most once per bucket rather than once per run.
+        """
+        prefix = _SAMPLE_PREFIX
+        rule_id = _SAMPLE_EXPIRY_RULE_ID
+        try:
+            if self.bucket_name not in _EXPIRY_RULE_BUCKETS:
+                try:
+                    rules = self.s3.get_bucket_lifecycle_configuration(Bucket=self.bucket_name)['Rules']
+                except self.s3.exceptions.ClientError as e:
+                    if e.response['Error']['Code'] != 'NoSuchLifecycleConfiguration':
+                        raise
+                    rules = []
+                
+                # Existing rules are kept; only a missing sample rule triggers a write
+                if not any(rule.get('ID') == rule_id for rule in rules):
+                    rules.append({
+                        'ID': rule_id,
+                        'Filter': {'Prefix': prefix},
+                        'Status': 'Enabled',
+                        'Expiration': {'Days': 1}
+                    })
+                    self.s3.put_bucket_lifecycle_configuration(
+                        Bucket=self.bucket_name,
+                        LifecycleConfiguration={'Rules': rules}
+                    )
+                _EXPIRY_RULE_BUCKETS.add(self.bucket_name)
+            
+            logger.info(LazyJSON({
+                "Data_Source": "S3_Operations",
+                "Data_Target": "Sample_Expiry_Scheduled",
+                "Data_Artifacts": {
+                    "bucket_name": self.bucket_name,
+                    "prefix": prefix,
+                    "rule_id": rule_id,
+                    "action": "sample_expiry_scheduled",
+                    "aws_service": "S3"
+                }
+            }))
+            
+            return {
+                'objects_deleted': 0,
+                'operations': [{
+                    'operation': 'EXPIRE_SAMPLE_OBJECTS',
+                    'status': 'scheduled',
+                    'prefix': prefix,
+                    'rule_id': rule_id
+                }]
+            }
+            
+        except Exception as e:
+            logger.info(LazyJSON({
+                "Data_Source": "S3_Operations",
+                "Data_Target": "Sample_Expiry_Error",
+                "Data_Artifacts": {
+                    "bucket_name": self.bucket_name,
+                    "prefix": prefix,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "action": "sample_expiry_error",
+                    "aws_service": "S3"
+                }
+            }))
+            
+            return {
+                'objects_deleted': 0,
+                'operations': [{
+                    'operation': 'EXPIRE_SAMPLE_OBJECTS',
+                    'status': 'failed',
+                    'prefix': prefix,
+                    'error': str(e)
+                }]
+            }